@@ -1,14 +1,17 @@
+import io
 import json
+import multiprocessing
 import os
+import re
+from functools import cache, lru_cache
 
 import click
 import dotenv
-import matplotlib
-import matplotlib.pyplot as plt
+import numpy as np
+import orjson
 import pandas as pd
 import pvlib
 import pyproj  # [MIT Licence] transformation of coordinates for DWD data
-import seaborn as sns
 from geopy.geocoders import Nominatim  # [MIT Licence] get location from coordinates
 
 import sodele
@@ -16,11 +19,18 @@ from dbi.dbi_connect_get_token import get_token
 from dbi.dbi_fetch_weather_data import fetch_weather_data
 from sodele import simulatePVPlants
 from sodele.Config import logging
+from sodele.Helper import NpJsonEncoder
 from sodele.Helper.dictor import dictor
+from sodele.Objects.WeatherData import FLOAT32_COLUMNS
 
 # load the .env file
 dotenv.load_dotenv()
 
+# separator line between header and data block of a DWD TRY .dat file
+DAT_SEPARATOR_REGEX = re.compile(rb"^\*\*\*[ \t\r]*$", re.MULTILINE)
+# metadata lines of the .dat header as "key : value"
+DAT_HEADER_REGEX = re.compile(r"^(Rechtswert|Hochwert|Hoehenlage|Art des TRY|Bezugszeitraum)\s*:(.*)$", re.MULTILINE)
+
 
 def requestTryData(latitude, longitude):
     """
@@ -41,37 +51,63 @@ def requestTryData(latitude, longitude):
 
     access_token = get_token(DBI_CONNECT_URL, DBI_CONNECT_CLIENT_SECRET, DBI_CONNECT_CLIENT_ID)
     df_weatherData, latitude, longitude = fetch_weather_data(DBI_DIETER_URL, latitude, longitude, access_token)
-    month = df_weatherData["MM"]
-    day = df_weatherData["DD"]
-    hour = df_weatherData["HH"]
-
-    # adjust units
-    df_weatherData["p"] = df_weatherData["p"] * 100  # convert hPa to Pa to be consistent with EPW
-
-    df_weatherData.index = pd.DatetimeIndex(pd.date_range(start=f'{2015}-01-01 00:00:00', end=f'{2015}-12-31 23:00:00', freq='H', tz=int(1 * 60 * 60)))
-    df_weatherData["temp_air"] = df_weatherData["t"]
-    df_weatherData["relative_humidity"] = df_weatherData["RF"]
-    df_weatherData["wind_speed"] = df_weatherData["WG"]
-    df_weatherData["atmospheric_pressure"] = df_weatherData["p"]
-    df_weatherData["dhi"] = df_weatherData["D"]  # diffus horizontal radiation, naming as in pvlib/EPW
-    df_weatherData["ghi"] = df_weatherData["dhi"] + df_weatherData["B"]  # global horizontal radiation = direct and diffuse horizontal radiation
-
-    weatherData = sodele.WeatherData(
-        altitude=0,
-        kind="try",
+
+    # create the weather data at once from the raw arrays, no index alignment is needed for the rows of the same response
+    diffuseHorizontalRadiation = df_weatherData["D"].to_numpy()
+    df_weatherData = pd.DataFrame({
+        "temp_air": df_weatherData["t"].to_numpy(),
+        "relative_humidity": df_weatherData["RF"].to_numpy(),
+        "wind_speed": df_weatherData["WG"].to_numpy(),
+        "atmospheric_pressure": df_weatherData["p"].to_numpy() * 100,  # convert hPa to Pa to be consistent with EPW
+        "dhi": diffuseHorizontalRadiation,  # diffus horizontal radiation, naming as in pvlib/EPW
+        "ghi": diffuseHorizontalRadiation + df_weatherData["B"].to_numpy(),  # global horizontal radiation = direct and diffuse horizontal radiation
+    }, index=pd.DatetimeIndex(pd.date_range(start=f'{2015}-01-01 00:00:00', end=f'{2015}-12-31 23:00:00', freq='H', tz=int(1 * 60 * 60))))
+
+    weatherData = createTryWeatherData(df_weatherData, latitude, longitude, altitude=0, kind="try", tz=1)
+
+    logging().info(f"The weather data has been loaded from predownloaded DWD TRY files for Lat: '{latitude}' and Long: '{longitude}' with {df_weatherData.shape[0]} datapoints successfully.")
+
+    return weatherData
+
+
+def createTryWeatherData(df_weatherData, latitude, longitude, altitude, kind, tz):
+    """
+    Creates the weather data object for DWD TRY data, either read in from a .dat file or requested from DIETER.
+    The irradiation data of TRY datasets is the average of the past hour and the DNI is not included,
+    therefore the time stamps are shifted by 30 minutes and the DNI is recalculated.
+
+    The measured values of FLOAT32_COLUMNS are stored as float32 like for deserialized weather data,
+    the irradiation and the pressure stay float64.
+
+    :param df_weatherData:  The weather data.
+    :type df_weatherData:   pd.DataFrame
+    :param latitude:        The latitude.
+    :type latitude:         float
+    :param longitude:       The longitude.
+    :type longitude:        float
+    :param altitude:        The altitude.
+    :type altitude:         float
+    :param kind:            The kind of the TRY dataset.
+    :type kind:             str
+    :param tz:              The timezone.
+    :type tz:               int
+    :return:    The weather data.
+    :rtype:     sodele.WeatherData
+    """
+    df_weatherData = df_weatherData.astype({column: np.float32 for column in df_weatherData.columns.intersection(FLOAT32_COLUMNS)}, copy=False)
+
+    return sodele.WeatherData(
+        altitude=altitude,
+        kind=kind,
         years=1,
         latitude=latitude,
         longitude=longitude,
-        tz=1,
+        tz=tz,
         adjustTimestamp=True,
         recalculateDNI=True,
         timeshiftInMinutes=30,
         df_weatherData=df_weatherData)
 
-    logging().info(f"The weather data has been loaded from predownloaded DWD TRY files for Lat: '{latitude}' and Long: '{longitude}' with {df_weatherData.shape[0]} datapoints successfully.")
-
-    return weatherData
-
 
 def readInDatFile(datFilePath):
     """
@@ -120,54 +156,91 @@ def readInDatFile(datFilePath):
     - coordinates will be transformes in standard WGS 84 system and writte to header data
     - air pressure will be changed from hPa to Pa in accordance of pvlib convention
 
+    The parsed file is cached per path, so repeated calls for the same file (e.g. in batch runs) only
+    hand out copies of the already parsed data instead of reading the file again.
+
+    """
+    df_weatherData, metadata = readInDatFileCached(str(datFilePath))
+
+    # hand out copies as the weather data is adjusted in place during the simulation
+    return df_weatherData.copy(), dict(metadata)
+
+
+@lru_cache(maxsize=32)
+def readInDatFileCached(datFilePath):
+    """
+    Reads in and caches a *.dat file from DWD TRY dataset. See readInDatFile for details.
+    The returned objects are shared between all callers and must not be modified.
+
+    :param datFilePath:     The path to the .dat file.
+    :type datFilePath:      str
+    :return:    The weather data and the metadata of the header.
+    :rtype:     (pd.DataFrame, dict)
     """
     # read in the weather data in .dat weather file format as it comes from the DWD website
-    # open file
+    # read the whole file at once, header and data block are separated in memory afterwards
     try:
-        datfile = open(str(datFilePath), 'r')
+        with open(datFilePath, 'rb') as datfile:
+            content = datfile.read()
     except Exception as e:
         raise ValueError(f"Could not read in the .dat weather data file {datFilePath}. The following error occured: " + str(e))
 
-    # read metadata from header
-    metadata = dict()
-    currentline = 0
-    for line in datfile:
-        # read in line by line of header
-        row = line.rstrip().split(":", 1)
-
-        # assine header data to header dict if needed
-        try:
-            if currentline == 1:
-                value = int(row[1].split()[0])
-                metadata['Rechtswert'] = value
-            elif currentline == 2:
-                value = int(row[1].split()[0])
-                metadata['Hochwert'] = value
-            elif currentline == 3:
-                value = float(row[1].split()[0])
-                metadata['altitude'] = value
-            elif currentline == 6:
-                value = str(row[1])
-                metadata['kind'] = value
-            elif currentline == 7:
-                value = str(row[1])
-                metadata['years'] = value
-            elif currentline == 32:  # get column names for data as between column names and data is a separator line (***)
-                columnnames = row[0].split()
-        except Exception as e:
-            raise ValueError(f"Could not read in the header of .dat weather data file {datFilePath}. The following error occured: " + str(e))
-
-        currentline += 1
-
-        # beak loop of reding the header if data block has startet. Begin of data has to start with "***""
-        if row[0] == '***':
-            break
+    return parseDatFile(content, datFilePath)
+
+
+@lru_cache(maxsize=4)
+def getTransformer(inProj, outProj):
+    """
+    Returns a pyproj transformer between two coordinate systems.
+    Building a transformer loads the PROJ database, so it is only built once per pair of coordinate systems.
+
+    :param inProj:  The input projection, e.g. 'EPSG:3034'.
+    :type inProj:   str
+    :param outProj: The output projection, e.g. 'EPSG:4326'.
+    :type outProj:  str
+    :return:        The transformer.
+    :rtype:         pyproj.Transformer
+    """
+    return pyproj.Transformer.from_crs(inProj, outProj)
+
+
+def parseDatFile(content, datFilePath):
+    """
+    Parses the header and the data block of the content of a *.dat file from DWD TRY dataset.
+
+    :param content:         The content of the .dat file.
+    :type content:          bytes
+    :param datFilePath:     The path to the .dat file, only used for error messages.
+    :type datFilePath:      str
+    :return:    The weather data and the metadata of the header.
+    :rtype:     (pd.DataFrame, dict)
+    """
+    # find the separator line between header and data block. Begin of data has to start with "***"
+    separator = DAT_SEPARATOR_REGEX.search(content)
+    if separator is None:
+        raise ValueError(f"Could not read in the .dat weather data file {datFilePath}. Checke the .dat file and make sure, that the datapoints begin with ""***""!")
+
+    # read metadata from header by the keys in front of the colon instead of by line numbers
+    header = content[:separator.start()].decode("latin-1")
+    headerValues = {key: value.rstrip() for key, value in DAT_HEADER_REGEX.findall(header)}
+    try:
+        metadata = {
+            'Rechtswert': int(headerValues['Rechtswert'].split()[0]),
+            'Hochwert': int(headerValues['Hochwert'].split()[0]),
+            'altitude': float(headerValues['Hoehenlage'].split()[0]),
+            'kind': headerValues['Art des TRY'],
+            'years': headerValues['Bezugszeitraum'],
+        }
+        # get column names for data from the last line in front of the separator line (***)
+        columnnames = next(line for line in reversed(header.splitlines()) if line.strip()).split()
+    except Exception as e:
+        raise ValueError(f"Could not read in the header of .dat weather data file {datFilePath}. The following error occured: " + str(e))
 
     # calculate latitude and longitude from Hochwert and Rechtswert from header
     # using pyproj from https://github.com/pyproj4/pyproj (MIT license)
     inProj = 'EPSG:3034'  # Input Projection: EPSG system used by DWD for TRY data (Lambert-konforme konische Projektion)
     outProj = 'EPSG:4326'  # Output Projection: World Geodetic System 1984 (WGS 84) 
-    transformer = pyproj.Transformer.from_crs(inProj, outProj)
+    transformer = getTransformer(inProj, outProj)
     lat, lon = transformer.transform(metadata['Hochwert'], metadata['Rechtswert'])
 
     # write position information to metadata dict
@@ -175,10 +248,11 @@ def readInDatFile(datFilePath):
     metadata['longitude'] = lon
     metadata['TZ'] = 1
 
-    # read data points
-    # already used readline above, therefore no rows has to be skipped here!
+    # read data points behind the separator line using the C parser of pandas
+    # the header lines are skipped by the parser itself, so the content is not copied for slicing off the header
+    headerLineCount = content.count(b"\n", 0, separator.start()) + 1
     try:
-        dat_data = pd.read_table(datfile, header=None, names=columnnames, delim_whitespace=True)
+        dat_data = pd.read_csv(io.BytesIO(content), skiprows=headerLineCount, sep=r"\s+", engine="c", header=None, names=columnnames, dtype=np.float64)
     except Exception as e:
         raise ValueError(f"Could not read the datapoints in the .dat weather data file {datFilePath}. The following error occured: " + str(e))
 
@@ -192,25 +266,27 @@ def readInDatFile(datFilePath):
     # adjust units 
     dat_data["p"] = dat_data["p"] * 100  # convert hPa to Pa to be consistent with EPW
 
-    df_weatherData = pd.DataFrame()
-    df_weatherData.index = dat_data.index
-    df_weatherData["temp_air"] = dat_data["t"]
-    df_weatherData["relative_humidity"] = dat_data["RF"]
-    df_weatherData["wind_speed"] = dat_data["WG"]
-    df_weatherData["atmospheric_pressure"] = dat_data["p"]
-    df_weatherData["dhi"] = dat_data["D"]  # diffus horizontal radiation, naming as in pvlib/EPW
-    df_weatherData["ghi"] = df_weatherData["dhi"] + dat_data["B"]  # global horizontal radiation = direct and diffuse horizontal radiation
+    # create the weather data at once so that pandas allocates a single block
+    df_weatherData = pd.DataFrame({
+        "temp_air": dat_data["t"],
+        "relative_humidity": dat_data["RF"],
+        "wind_speed": dat_data["WG"],
+        "atmospheric_pressure": dat_data["p"],
+        "dhi": dat_data["D"],  # diffus horizontal radiation, naming as in pvlib/EPW
+        "ghi": dat_data["D"].to_numpy() + dat_data["B"].to_numpy(),  # global horizontal radiation = direct and diffuse horizontal radiation
+    }, index=dat_data.index)
 
     return df_weatherData, metadata
 
 
 def readInEPWFile(epwFile):
-    df_weather, metadata = pvlib.iotools.read_epw(epwFile)
-    year = df_weather["year"]
-    month = df_weather["month"]
-    day = df_weather["day"]
-    hour = df_weather["hour"]
-    df_weather["timeStamps"] = pd.to_datetime(dict(year=year, month=month, day=day, hour=hour))
+    # EPW files are written with the Windows code page (e.g. the quotes in the header of the DWD TRY EPW files),
+    # pvlib.iotools.read_epw would open them with the encoding of the locale instead
+    with open(epwFile, 'r', encoding="cp1252") as epwFileHandle:
+        df_weather, metadata = pvlib.iotools.parse_epw(epwFileHandle)
+    # pvlib builds the index from year, month, day and hour - 1 of each row in the EPW file,
+    # so the time stamps (with hours from 1 to 24) are derived from the index without parsing each row again
+    df_weather["timeStamps"] = df_weather.index.tz_localize(None) + pd.Timedelta(hours=1)
 
     logging().info(f"The EPW weather file '{epwFile}' with {df_weather.shape[0]} datapoints was read in successfully.")
 
@@ -233,17 +309,10 @@ def readInWeatherDataFile(weatherDataFile):
 
         logging().info(f"The DWD .dat weather file '{weatherDataFile}' of kind '{metadata['kind'][1:]}' from the years {metadata['years']} with {df_weatherData.shape[0]} datapoints was read in successfully.")
 
-        return sodele.WeatherData(
-            altitude=metadata["altitude"],
-            kind=metadata['kind'] + " of the years " + metadata['years'],
-            years=1,
-            latitude=metadata["latitude"],
-            longitude=metadata["longitude"],
-            tz=metadata["TZ"],
-            adjustTimestamp=True,
-            recalculateDNI=True,
-            timeshiftInMinutes=30,
-            df_weatherData=df_weatherData)
+        return createTryWeatherData(df_weatherData, metadata["latitude"], metadata["longitude"],
+                                    altitude=metadata["altitude"],
+                                    kind=metadata['kind'] + " of the years " + metadata['years'],
+                                    tz=metadata["TZ"])
 
     elif weatherDataFile.endswith(".epw"):
         return readInEPWFile(weatherDataFile)
@@ -252,6 +321,14 @@ def readInWeatherDataFile(weatherDataFile):
 
 
 def visualizePVPlants(energyProfiles, energyAreaProfiles, resultPath, showPlot, plantEnergyKWPSum, plantAreaTotal, plantPowerTotal, plantEnergySum):
+    # plotting libraries are imported here as importing them is slow and not needed for the simulation itself
+    import matplotlib
+    if not showPlot:
+        # the plots are only saved to files, so no interactive backend is needed
+        matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
     fignum = 0
 
     def create_hourly_plot(df_data, col_idx, color, sum_pv, sum_pv_power, sum_pv_area, max_value=None, with_text=True):
@@ -259,7 +336,7 @@ def visualizePVPlants(energyProfiles, energyAreaProfiles, resultPath, showPlot,
         # Create a barplot of the data
         plt.figure(fignum)
         fignum += 1
-        sns.lineplot(data=df_data, x=df_data.index, y=df_data.columns[col_idx], color=color)
+        plt.plot(df_data.index, df_data.iloc[:, col_idx].to_numpy(), color=color)
         plt.title(f"PV-Leistungsprofil für PV-Anlage {col_idx}")
         plt.xlabel('Zeitschritte im Jahr (entspricht Zeitschrittweite des Wetterdatensatzes)')
         plt.ylabel('el. Leistung gemittelt über Zeitschritt [kW]')
@@ -333,20 +410,18 @@ def visualizePVPlants(energyProfiles, energyAreaProfiles, resultPath, showPlot,
         columns = df_data.columns
         used_columns = columns[:-1]
         df_data = df_data[used_columns]
-        # melt to create a comparison plot
-        df_data = df_data.melt(ignore_index=False)
-        # rename the "variable" column to "PV-Anlage"
-        df_data = df_data.rename(columns={"variable": "PV-Anlage"})
-        # Create a barplot of the data
+        # maximum over all plants for the y axis range
+        max_value = df_data.to_numpy().max()
+        # Create a lineplot of the data with one line per plant
         plt.figure(fignum)
         fignum += 1
-        sns.lineplot(data=df_data, x=df_data.index, y="value", hue="PV-Anlage", palette=color_map)
+        for column in used_columns:
+            plt.plot(df_data.index, df_data[column].to_numpy(), color=color_map[column], label=column)
+        plt.legend(title="PV-Anlage")
         plt.title("Vergleich PV-Energieprofil aller PV-Anlagen")
         plt.xlabel('Zeitschritte im Jahr (entspricht Zeitschrittweite des Wetterdatensatzes)')
         plt.ylabel('Energieprofil [kW]')
 
-        max_value = df_data['value'].max()
-
         # set the y axis range from 0-1.1 times the max value
         plt.ylim(0, max_value * 1.1)
 
@@ -356,6 +431,8 @@ def visualizePVPlants(energyProfiles, energyAreaProfiles, resultPath, showPlot,
         columns = df_data.columns
         used_columns = columns[:-1]
         df_data = df_data[used_columns]
+        # maximum over all plants for the y axis range, the data is melted for the barplot below
+        max_value = df_data.to_numpy().max()
         # melt to create a comparison plot
         df_data = df_data.melt(ignore_index=False)
 
@@ -369,8 +446,6 @@ def visualizePVPlants(energyProfiles, energyAreaProfiles, resultPath, showPlot,
         plt.xlabel('Zeitschritte im Jahr')
         plt.ylabel('el. Leistung gemittelt über Zeitschritt [kW]')
 
-        max_value = df_data['value'].max()
-
         # set the y axis range from 0-1.1 times the max value
         plt.ylim(0, max_value * 1.1)
 
@@ -383,14 +458,12 @@ def visualizePVPlants(energyProfiles, energyAreaProfiles, resultPath, showPlot,
     numberOfPlants = len(energyProfiles) - 1
     columns = [f"PV_Plant_{i}" for i in range(numberOfPlants)] + ["Summary of all Plants"]
 
-    df_energyProfileSummary = pd.DataFrame()
-    df_areaProfileSummary = pd.DataFrame()
-    df_energyProfileSummary.index = pd.DatetimeIndex(pd.date_range(start=f'{2015}-01-01 00:00:00', end=f'{2015}-12-31 23:00:00', freq='H'))  # tz in seconds with respect to GMT
-    df_areaProfileSummary.index = pd.DatetimeIndex(pd.date_range(start=f'{2015}-01-01 00:00:00', end=f'{2015}-12-31 23:00:00', freq='H'))  # tz in seconds with respect to GMT
-    for idx, col in enumerate(columns):
-        # add the data to the dataframe
-        df_energyProfileSummary[col] = energyProfiles[idx]
-        df_areaProfileSummary[col] = energyAreaProfiles[idx]
+    # time axis of all plots, shared by both dataframes
+    timeIndex = pd.date_range(start=f'{2015}-01-01 00:00:00', end=f'{2015}-12-31 23:00:00', freq='H')
+
+    # create the dataframes at once instead of adding the profiles column by column
+    df_energyProfileSummary = pd.DataFrame(dict(zip(columns, energyProfiles)), index=timeIndex)
+    df_areaProfileSummary = pd.DataFrame(dict(zip(columns, energyAreaProfiles)), index=timeIndex)
 
     # set the global pplot to 16x9
     plt.rcParams['figure.figsize'] = [21, 9]
@@ -415,6 +488,9 @@ def visualizePVPlants(energyProfiles, energyAreaProfiles, resultPath, showPlot,
         color = color_map[df_energyProfileSummary.columns[pv_plant_idx]]
         create_hourly_plot(df_energyProfileSummary, pv_plant_idx, color, sum_pv_energy, sum_pv_energy_power_rel, sum_pv_energy_area_related)
         plt.savefig(f"{resultPath}/PV-Leistungsprofil für PV-Anlage {pv_plant_idx}.png")
+        # the hourly plots are only kept open to be shown at the end
+        if not showPlot:
+            plt.close()
 
         create_aggregated_plot(df_energyProfileSummary, pv_plant_idx, color, sum_pv_energy, sum_pv_energy_power_rel, sum_pv_energy_area_related, 'M', months, rot=-45)
         plt.savefig(f"{resultPath}/PV-Leistungsprofil für PV-Anlage {pv_plant_idx} aggregated per month.png")
@@ -433,6 +509,9 @@ def visualizePVPlants(energyProfiles, energyAreaProfiles, resultPath, showPlot,
     color = color_map[df_energyProfileSummary.columns[sum_axis]]
     create_hourly_plot_summed(df_energyProfileSummary, sum_axis, color, sum_pv_energy, sum_pv_energy_power_rel, sum_pv_energy_area_related)
     plt.savefig(f"{resultPath}/Summiertes PV-Leistungsprofil aller PV-Anlagen.png")
+    # the hourly plots are only kept open to be shown at the end
+    if not showPlot:
+        plt.close()
 
     create_aggregated_plot_summed(df_energyProfileSummary, sum_axis, color, sum_pv_energy, sum_pv_energy_power_rel, sum_pv_energy_area_related, 'M', months, rot=-45)
     plt.savefig(f"{resultPath}/Summiertes PV-Leistungsprofil aller PV-Anlagen aggregated per month.png")
@@ -447,6 +526,9 @@ def visualizePVPlants(energyProfiles, energyAreaProfiles, resultPath, showPlot,
     # create comparison plots
     create_hourly_compare_plot(df_energyProfileSummary, color_map)
     plt.savefig(f"{resultPath}/Vergleich PV-Energieprofil aller PV-Anlagen.png")
+    # the hourly plots are only kept open to be shown at the end
+    if not showPlot:
+        plt.close()
 
     create_aggregated_compare_plot(df_energyProfileSummary, color_map, 'M', months, rot=-45)
     plt.savefig(f"{resultPath}/Vergleich PV-Energieprofil aller PV-Anlagen aggregated per month.png")
@@ -466,6 +548,17 @@ def visualizePVPlants(energyProfiles, energyAreaProfiles, resultPath, showPlot,
     plt.close('all')
 
 
+@cache
+def getGeocoder():
+    """
+    Returns the geocoder used to receive location information. It is created only once per process.
+
+    :return:    The geocoder.
+    :rtype:     Nominatim
+    """
+    return Nominatim(user_agent="Sodele")
+
+
 # Functino to receive location information and print them to the log
 def print_location_information(latitude, longitude):
     # print location info of weather file
@@ -476,7 +569,7 @@ def print_location_information(latitude, longitude):
 
     # get location name using geopy (https://github.com/geopy/geopy) (MIT License)
     try:
-        geolocator = Nominatim(user_agent="Sodele")
+        geolocator = getGeocoder()
         location = geolocator.reverse(str(latitude) + "," + str(longitude))
         address = location.raw['address']
 
@@ -531,8 +624,8 @@ def simulatePv(input_json):
         weatherData = readInWeatherDataFile(weatherDataFile)  # .dat or .epw file externally given by absolute or relative path
     else:
         weatherData = requestTryData(latitude, longitude)  # modified .dat file crawled from DWD and saved locally
-    inputJsonDict["weatherData"] = weatherData.serialize()
-    sodeleInput = sodele.SodeleInput.deserialize(inputJsonDict)
+    # the loaded weather data is used directly instead of a serialize and deserialize round trip
+    sodeleInput = sodele.SodeleInput.deserialize(inputJsonDict, weatherData)
 
     print_location_information(weatherData.latitude, weatherData.longitude)
 
@@ -565,9 +658,9 @@ def simulatePv(input_json):
     if not os.path.exists(resultPath):
         os.makedirs(resultPath)
 
-    # save the result
-    with open(resultPath + "/result.json", "w") as f:
-        json.dump(result, f, indent=4)
+    # save the result, numpy arrays that orjson can not serialize natively fall back to the NpJsonEncoder
+    with open(resultPath + "/result.json", "wb") as f:
+        f.write(orjson.dumps(result, default=NpJsonEncoder().default, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
 
     visualizePVPlants(energyProfiles, energyAreaProfiles, resultPath, sodeleInput.showPlots, plantEnergyKWPSum, plantAreaTotal, plantPowerTotal, plantEnergySum)
 
@@ -588,4 +681,6 @@ main.add_command(simulatePv)
 main.add_command(generatePVDatabase)
 
 if __name__ == "__main__":
+    # needed for the simulation worker processes in the frozen exe
+    multiprocessing.freeze_support()
     main()
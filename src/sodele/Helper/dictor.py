@@ -1,14 +1,26 @@
+import operator
+from functools import lru_cache, reduce
+
+
+@lru_cache(maxsize=256)
+def splitPath(path):
+    return tuple(path.split("."))
+
+
 def dictor(data, path, default=None):
     try:
-        path = path.split(".")
-        tmp = data
-        for key in path:
-            tmp = tmp[key]
-            if isinstance(tmp, str):
-                try:
-                    tmp = float(tmp)
-                except ValueError:
-                    tmp = tmp
-        return tmp
-    except KeyError:
+        if "." in path:
+            tmp = reduce(operator.getitem, splitPath(path), data)
+        else:
+            # flat keys are the common case in the deserialize methods and need no traversal
+            tmp = data[path]
+    except (KeyError, TypeError, IndexError):
         return default
+
+    # only the resulting value is converted, intermediate values are dicts or lists
+    if isinstance(tmp, str):
+        try:
+            tmp = float(tmp)
+        except ValueError:
+            pass
+    return tmp
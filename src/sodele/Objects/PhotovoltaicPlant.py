@@ -1,10 +1,32 @@
 import uuid
+from functools import cache
 
+import numpy as np
 import pvlib
 
 from sodele.Helper.dictor import dictor
 import sodele.Helper.optionsConcstructor as optConstruct
 
+# (ModuleDatabase, InverterDatabase) per modules database type, relative to the working directory like the exe expects
+DATABASE_PATHS = {
+    1: ("./src/sodele/res/PV_Database/220225_Sandia_Modules.csv", "./src/sodele/res/PV_Database/221115_CEC_Inverters.csv"),
+    2: ("./src/sodele/res/PV_Database/221115_CEC_Modules.csv", "./src/sodele/res/PV_Database/221115_CEC_Inverters.csv"),
+}
+
+
+@cache
+def loadDatabase(databasePath: str):
+    """
+    Reads a module or inverter database once per process.
+
+    The returned DataFrame is shared between all plants and must not be modified.
+
+    :param databasePath:    The path to the database csv file.
+    :type databasePath:     str
+    :return:                pd.DataFrame
+    """
+    return pvlib.pvsystem.retrieve_sam(name=None, path=databasePath)
+
 
 class PhotovoltaicPlant:
     """
@@ -41,14 +63,14 @@ class PhotovoltaicPlant:
     :type moduleInstallation:       int
 
     :param energyProfile:           (result) The energy profile of the photovoltaic plant.
-    :type energyProfile:            list[float] | None
+    :type energyProfile:            np.ndarray | None
     :param surfaceArea:             (result) The surface area of the photovoltaic plant.
     :type surfaceArea:              float | None
     :param systemKWP:               (result) The system KWP of the photovoltaic plant.
     :type systemKWP:                float | None
 
     :param energyProfileArea:       (result) The energy profile area of the photovoltaic plant.
-    :type energyProfileArea:        list[float] | None
+    :type energyProfileArea:        np.ndarray | None
     :param energyProfileSum:        (result) The energy profile sum of the photovoltaic plant.
     :type energyProfileSum:         float | None
     :param energyProfileAreaSum:    (result) The energy profile area sum of the photovoltaic plant.
@@ -82,6 +104,18 @@ class PhotovoltaicPlant:
     :type moduleName:                   str
     """
 
+    # fixed attribute layout, including the results that are set after the simulation
+    __slots__ = ("uid",
+                 "surfaceAzimuth", "surfaceTilt",
+                 "modulesPerString", "stringsPerInverter", "numberOfInverters",
+                 "albedo", "moduleInstallation",
+                 "moduleName",
+                 "lossesIrradiation", "lossesDCDatasheet", "lossesDCCables",
+                 "modulesDatabaseType", "modulesDatabasePath", "invertersDatabasePath",
+                 "useInverterDatabase", "inverterName", "useStandByPowerInverter", "inverterEta",
+                 "energyProfile", "surfaceArea", "systemKWP",
+                 "energyProfileArea", "energyProfileSum", "energyProfileAreaSum", "energyKWPSum")
+
     def __init__(self,
                  uid,
                  surfaceAzimuth: float, surfaceTilt: float,
@@ -222,17 +256,9 @@ class PhotovoltaicPlant:
         :type modulesDatabaseType:      int
         :return:                        (ModuleDatabase, InverterDatabase)
         """
-        if modulesDatabaseType == 1:
-            moduleDatabasePath = "./src/sodele/res/PV_Database/220225_Sandia_Modules.csv"
-            inverterDatabasePath = "./src/sodele/res/PV_Database/221115_CEC_Inverters.csv"
-            return moduleDatabasePath, inverterDatabasePath
-
-        elif modulesDatabaseType == 2:
-            moduleDatabasePath = "./src/sodele/res/PV_Database/221115_CEC_Modules.csv"
-            inverterDatabasePath = "./src/sodele/res/PV_Database/221115_CEC_Inverters.csv"
-            return moduleDatabasePath, inverterDatabasePath
-
-        else:
+        try:
+            return DATABASE_PATHS[modulesDatabaseType]
+        except KeyError:
             raise Exception(f"The given modules database type '{modulesDatabaseType}' is not supported.")
 
     def calculateProfileMetrics(self):
@@ -246,17 +272,22 @@ class PhotovoltaicPlant:
         :return:
         """
 
-        self.energyProfileSum = sum(self.energyProfile)
-        self.energyProfileArea = [energyProfileValue / self.surfaceArea for energyProfileValue in self.energyProfile]
+        energyProfile = np.asarray(self.energyProfile, dtype=np.float64)
+        self.energyProfileSum = float(energyProfile.sum())
+        self.energyProfileArea = energyProfile / self.surfaceArea
         self.energyProfileAreaSum = self.energyProfileSum / self.surfaceArea
         self.energyKWPSum = self.energyProfileSum / self.systemKWP
 
     def getModulesAndInverters(self):
         # set chosen module and inverter from database
-        PV_modules = pvlib.pvsystem.retrieve_sam(name=None, path=self.modulesDatabasePath)
+        PV_modules = loadDatabase(self.modulesDatabasePath)
+        if self.moduleName not in PV_modules.columns:
+            raise KeyError(f"The module '{self.moduleName}' is not in the modules database '{self.modulesDatabasePath}'.")
         current_module = PV_modules[self.moduleName]
 
-        PV_inverters = pvlib.pvsystem.retrieve_sam(name=None, path=self.invertersDatabasePath)
+        PV_inverters = loadDatabase(self.invertersDatabasePath)
+        if self.inverterName not in PV_inverters.columns:
+            raise KeyError(f"The inverter '{self.inverterName}' is not in the inverters database '{self.invertersDatabasePath}'.")
         current_inverter = PV_inverters[self.inverterName]
 
         return current_module, current_inverter
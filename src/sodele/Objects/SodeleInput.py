@@ -1,3 +1,5 @@
+from typing import Optional
+
 from sodele.Helper.dictor import dictor
 from sodele.Objects.PhotovoltaicPlant import PhotovoltaicPlant
 from sodele.Objects.WeatherData import WeatherData
@@ -22,17 +24,20 @@ class SodeleInput:
         self.weatherData = weatherData
 
     @staticmethod
-    def deserialize(json: dict):
+    def deserialize(json: dict, weatherData: Optional[WeatherData] = None):
         """
         Deserializes the sodele input.
 
-        :param json:    The json.
-        :type json:     dict
-        :return:        The sodele input.
-        :rtype:         SodeleInput
+        :param json:            The json.
+        :type json:             dict
+        :param weatherData:     Already loaded weather data, used instead of the weather data in the json.
+        :type weatherData:      WeatherData | None
+        :return:                The sodele input.
+        :rtype:                 SodeleInput
         """
         photovoltaicPlants = [PhotovoltaicPlant.deserialize(plant) for plant in json["PhotovoltaicPlants"]]
-        weatherData = WeatherData.deserialize(json["weatherData"])
+        if weatherData is None:
+            weatherData = WeatherData.deserialize(json["weatherData"])
         showPlots = dictor(json, "showPlots", True)
         return SodeleInput(photovoltaicPlants, showPlots, weatherData)
 
@@ -5,6 +5,10 @@ import pvlib
 import sodele.Helper.optionsConcstructor as optConstruct
 from sodele.Config import logging
 
+# measured weather values that fit into float32, the irradiation and pressure stay float64 for the pvlib solar and irradiance models
+# used for deserialized weather data and for the DWD TRY data read in by bin/app.py
+FLOAT32_COLUMNS = ("temp_air", "wind_speed", "wind_direction", "sky_cover", "precipitable_water", "relative_humidity", "athmospheric_heat_irr")
+
 
 class WeatherData:
     """
@@ -32,6 +36,11 @@ class WeatherData:
     :type df_weatherData:  pandas.DataFrame
     """
 
+    __slots__ = ("shouldAdjustTimestamp", "shouldRecalculateDNI", "timeshiftInMinutes",
+                 "altitude", "kind", "years",
+                 "latitude", "longitude", "tz",
+                 "df_weatherData")
+
     def __init__(self,
                  altitude: float,
                  kind: str, years: int,
@@ -70,9 +79,16 @@ class WeatherData:
         recalculateDNI = json["recalculateDNI"]
         timeshiftInMinutes = json["timeshiftInMinutes"]
 
-        df_weatherData = pd.DataFrame.from_dict(json["weatherData"])
-        # set index
-        df_weatherData.index = pd.to_datetime(json["weatherData"]['index'])
+        # build the dataframe directly on the time index, the index is not kept as an additional column
+        weatherData = json["weatherData"]
+        index = weatherData["index"]
+        if len(index) > 0 and isinstance(index[0], str):
+            # time stamps from a json file are ISO 8601 strings, the fixed format avoids guessing it per element
+            index = pd.to_datetime(index, format="ISO8601")
+        else:
+            index = pd.to_datetime(index)
+        df_weatherData = pd.DataFrame({column: np.asarray(values, dtype=np.float32) if column in FLOAT32_COLUMNS else values
+                                       for column, values in weatherData.items() if column != "index"}, index=index)
         return WeatherData(altitude,
                            kind, years,
                            latitude, longitude, tz,
@@ -85,7 +101,8 @@ class WeatherData:
         The time period, freqency and the time zone will not be affected!
         """
 
-        newTimeIndex = self.df_weatherData.index + pd.Timedelta(minutes=timeshift)
+        # shift the whole index at once, this keeps fractions of a minute, the frequency and the time zone of the index
+        newTimeIndex = self.df_weatherData.index + pd.to_timedelta(timeshift, unit="min")
         newStartTime = newTimeIndex[0]
 
         # set the new time index
@@ -106,9 +123,10 @@ class WeatherData:
                                                               method='nrel_numpy')
         # calculate direct normal iradiation using pvlib; fill nan values with zero nad replace -0.0 values with 0.0
         dni = pvlib.irradiance.dni(self.df_weatherData["ghi"], self.df_weatherData["dhi"], solarPosition["zenith"])  # dhi is diffuse horizontal radiation!
-        dni = dni.fillna(0.0)
-        dni = np.nan_to_num(dni, nan=0.0)
-        dni[dni == -0.0] = 0.0
+        dni = dni.to_numpy(dtype=np.float64, copy=True)
+        np.nan_to_num(dni, copy=False, nan=0.0)
+        # -0.0 + 0.0 is +0.0 in IEEE 754, so this replaces all -0.0 values without a separate comparison
+        dni += 0.0
 
         # replace the DNI column with the recalculated values
         self.df_weatherData["dni"] = dni
@@ -121,11 +139,10 @@ class WeatherData:
 
         :return:
         """
-        weatherData = self.df_weatherData.copy()
-        weatherData.reset_index(inplace=True)
-        weatherDataResult = {}
-        for column in weatherData.columns:
-            weatherDataResult[column] = weatherData[column].tolist()
+        # the index is written as the first column without copying the dataframe
+        weatherDataResult = {"index": self.df_weatherData.index.tolist()}
+        for column in self.df_weatherData.columns:
+            weatherDataResult[column] = self.df_weatherData[column].tolist()
 
         return {
             "altitude": self.altitude,
@@ -1,13 +1,110 @@
+from concurrent.futures import ProcessPoolExecutor
+
 import numpy as np
 import pandas as pd
 import pvlib
 
 from sodele.Config import logging, getConfig
+from sodele.Helper import getValueForKey
 from sodele.Objects.PhotovoltaicPlant import PhotovoltaicPlant
 from sodele.Objects.SodeleInput import SodeleInput
 
+# sapm temperature model per module installation type of the photovoltaic plant
+MODULE_INSTALLATION_TYPES = {
+    1: 'open_rack_glass_glass',
+    2: 'open_rack_glass_polymer',
+    3: 'close_mount_glass_glass',
+    4: 'insulated_back_glass_polymer'
+}
+
+# dc model per modules database type
+DC_MODELS = {
+    1: "sapm",
+    2: "cec",
+}
+
+# module parameters for the rated current, the rated voltage and the area per modules database type
+RATED_MODULE_PARAMETERS = {
+    1: ("Impo", "Vmpo", "Area"),  # Sandia
+    2: ("I_mp_ref", "V_mp_ref", "A_c"),  # CEC
+}
+
+
+class SharedSitePositionModelChain(pvlib.modelchain.ModelChain):
+    """
+    ModelChain that uses a solar position and airmass calculated once for all plants instead of calculating them for every plant.
+
+    Note: this overrides the private methods _prep_inputs_solar_pos and _prep_inputs_airmass that ModelChain.prepare_inputs
+    calls in pvlib 0.9.5, the version pinned in requirements.txt. The public ModelChain methods either calculate the solar
+    position themselves or expect the effective irradiance, which depends on it, so there is no public way to pass it in.
+    Check these methods when updating pvlib.
+
+    :param solarPosition:   the solar position for the time index of the weather data, see calculateSolarPosition
+    :type solarPosition:    pd.DataFrame
+    :param airmass:         the airmass for the solar position, see calculateAirmass
+    :type airmass:          pd.DataFrame
+    """
+
+    def __init__(self, system, location, solarPosition, airmass, **kwargs):
+        super().__init__(system, location, **kwargs)
+        self.solarPosition = solarPosition
+        self.sharedAirmass = airmass
+
+    def _prep_inputs_solar_pos(self, weather):
+        self.results.solar_position = self.solarPosition
+        return self
+
+    def _prep_inputs_airmass(self):
+        self.results.airmass = self.sharedAirmass
+        return self
+
+
+def calculateSolarPosition(weatherData):
+    """
+    Calculates the solar position the same way the ModelChain does it for every plant:
+    at the location of the weather data without altitude and with the air temperature of the weather data.
+    The solar position only depends on the site and the time, so it is shared by all plants.
+
+    :param weatherData:     the weather data
+    :type weatherData:      WeatherData
+    :return:                pd.DataFrame
+    """
+    location = pvlib.location.Location(weatherData.latitude, weatherData.longitude)
+    df_weather = weatherData.df_weatherData
+    return location.get_solarposition(df_weather.index, temperature=df_weather["temp_air"])
+
+
+def calculateAirmass(weatherData, solarPosition):
+    """
+    Calculates the airmass the same way the ModelChain does it for every plant, with the default airmass model.
 
-def CalcPVPowerProfile(sodeleInput, currentPVPlant):
+    :param weatherData:     the weather data
+    :type weatherData:      WeatherData
+    :param solarPosition:   the solar position, see calculateSolarPosition
+    :type solarPosition:    pd.DataFrame
+    :return:                pd.DataFrame
+    """
+    location = pvlib.location.Location(weatherData.latitude, weatherData.longitude)
+    return location.get_airmass(solar_position=solarPosition)
+
+
+def prepareWeather(weatherData):
+    """
+    Prepares the weather data for the model chain, which is the same for all plants:
+    the irradiation, the air temperature, the wind speed and the precipitable water.
+
+    :param weatherData:     the weather data
+    :type weatherData:      WeatherData
+    :return:                pd.DataFrame
+    """
+    df_weather = weatherData.df_weatherData
+    weather = df_weather[['ghi', 'dni', 'dhi', 'temp_air', 'wind_speed']].copy()
+    # calculate precipitate water as values in EWP-file are all zero
+    weather['precipitable_water'] = pvlib.atmosphere.gueymard94_pw(df_weather["temp_air"].to_numpy(), df_weather["relative_humidity"].to_numpy())
+    return weather
+
+
+def CalcPVPowerProfile(sodeleInput, currentPVPlant, solarPosition=None, moduleAndInverter=None, preparedWeather=None, airmass=None):
     """
     Calculates the PV power profile
 
@@ -15,34 +112,67 @@ def CalcPVPowerProfile(sodeleInput, currentPVPlant):
     :type sodeleInput:      SodeleInput
     :param currentPVPlant:  the current PV
     :type currentPVPlant:   PhotovoltaicPlant
-    :return:
+    :param solarPosition:   the solar position shared by all plants, calculated if not given
+    :type solarPosition:    pd.DataFrame | None
+    :param moduleAndInverter:   the module and inverter parameters of the plant, loaded from the databases if not given
+    :type moduleAndInverter:    tuple[pd.Series, pd.Series] | None
+    :param preparedWeather:     the weather data shared by all plants, see prepareWeather, prepared if not given
+    :type preparedWeather:      pd.DataFrame | None
+    :param airmass:             the airmass shared by all plants, calculated if not given
+    :type airmass:              pd.DataFrame | None
+    :return:                    the energy profile in kWh, the surface area in m^2 and the rated power in kWp
+    """
+    weatherData = sodeleInput.weatherData
+
+    # load the chosen module and inverter from the databases
+    if moduleAndInverter is None:
+        moduleAndInverter = currentPVPlant.getModulesAndInverters()
+    if solarPosition is None:
+        solarPosition = calculateSolarPosition(weatherData)
+    if airmass is None:
+        airmass = calculateAirmass(weatherData, solarPosition)
+    if preparedWeather is None:
+        preparedWeather = prepareWeather(weatherData)
+
+    return calculatePVPowerProfileAtSite(weatherData.latitude, weatherData.longitude, currentPVPlant, moduleAndInverter, solarPosition, airmass, preparedWeather)
+
+
+def calculatePVPowerProfileAtSite(latitude, longitude, currentPVPlant, moduleAndInverter, solarPosition, airmass, preparedWeather):
+    """
+    Calculates the PV power profile of a plant from the site and the data shared by all plants, see CalcPVPowerProfile.
+    The weather data itself is not needed, so only these values have to be sent to a worker process.
+
+    :param latitude:            the latitude of the site
+    :type latitude:             float
+    :param longitude:           the longitude of the site
+    :type longitude:            float
+    :param currentPVPlant:      the current PV
+    :type currentPVPlant:       PhotovoltaicPlant
+    :param moduleAndInverter:   the module and inverter parameters of the plant
+    :type moduleAndInverter:    tuple[pd.Series, pd.Series]
+    :param solarPosition:       the solar position shared by all plants, see calculateSolarPosition
+    :type solarPosition:        pd.DataFrame
+    :param airmass:             the airmass shared by all plants, see calculateAirmass
+    :type airmass:              pd.DataFrame
+    :param preparedWeather:     the weather data shared by all plants, see prepareWeather
+    :type preparedWeather:      pd.DataFrame
+    :return:                    the energy profile in kWh, the surface area in m^2 and the rated power in kWp
     """
     # start calculation
-    # load all available modules and inverters
-    current_module, current_inverter = currentPVPlant.getModulesAndInverters()
-
-    moduleInstallationSwitch = {
-        1: 'open_rack_glass_glass',
-        2: 'open_rack_glass_polymer',
-        3: 'close_mount_glass_glass',
-        4: 'insulated_back_glass_polymer'
-    }
+    current_module, current_inverter = moduleAndInverter
 
-    moduleInstallationType = moduleInstallationSwitch[currentPVPlant.moduleInstallation]
+    moduleInstallationType = MODULE_INSTALLATION_TYPES[currentPVPlant.moduleInstallation]
 
     # set temperature model type
     temperature_model_parameters = pvlib.temperature.TEMPERATURE_MODEL_PARAMETERS['sapm'][moduleInstallationType]
 
-    # location parameter from epw file
-    latitude = sodeleInput.weatherData.latitude
-    longitude = sodeleInput.weatherData.longitude
-
     # set location for model chain1
     location = pvlib.location.Location(latitude, longitude)
 
     # set system for model chain
     system_mc = pvlib.pvsystem.PVSystem(surface_tilt=currentPVPlant.surfaceTilt,
                                         surface_azimuth=currentPVPlant.surfaceAzimuth,
+                                        albedo=currentPVPlant.albedo,
                                         module_parameters=current_module,
                                         inverter_parameters=current_inverter,
                                         temperature_model_parameters=temperature_model_parameters,
@@ -66,38 +196,18 @@ def CalcPVPowerProfile(sodeleInput, currentPVPlant):
 
     # Note: watts sums up all losses, they are all handled the same!
 
-    dataBaseSwitch = {
-        1: "sapm",
-        2: "cec",
-    }
-
-    dc_model = dataBaseSwitch[currentPVPlant.modulesDatabaseType]
+    dc_model = DC_MODELS[currentPVPlant.modulesDatabaseType]
 
-    mc = pvlib.modelchain.ModelChain(system_mc, location,
-                                     dc_model=dc_model,
-                                     aoi_model='physical',
-                                     dc_ohmic_model="dc_ohms_from_percent",
-                                     losses_model="pvwatts")
+    mc = SharedSitePositionModelChain(system_mc, location, solarPosition, airmass,
+                                      dc_model=dc_model,
+                                      aoi_model='physical',
+                                      dc_ohmic_model="dc_ohms_from_percent",
+                                      losses_model="pvwatts")
 
-    # calculate precipitate water as values in EWP-file are all zero and convert to dataframe
-    df_weather = sodeleInput.weatherData.df_weatherData
-    precipitable_water = pvlib.atmosphere.gueymard94_pw(df_weather["temp_air"].values, df_weather["relative_humidity"].values)
-    precipitable_water_DF = pd.DataFrame(precipitable_water, columns=['precipitable_water'], index=df_weather["temp_air"].index)
-
-    # create DataFrame of albedo
-    albedo = pd.DataFrame(currentPVPlant.albedo * np.ones((df_weather["temp_air"].size, 1)), columns=['albedo'], index=df_weather["temp_air"].index)
-
-    # create data frame with weather data including reduction factor as pvlib requests
-    losses_irradiation = currentPVPlant.lossesIrradiation
-    weather_data = [(1 - losses_irradiation / 100) * df_weather['ghi'],
-                    (1 - losses_irradiation / 100) * df_weather['dni'],
-                    (1 - losses_irradiation / 100) * df_weather['dhi'],
-                    df_weather["temp_air"],
-                    df_weather["wind_speed"],
-                    precipitable_water_DF['precipitable_water'],
-                    albedo['albedo']]
-
-    weather = pd.concat(weather_data, axis=1)
+    # create data frame with weather data including reduction factor as pvlib requests, the albedo is a scalar of the system
+    weather = preparedWeather.copy()
+    irradiation_factor = 1 - currentPVPlant.lossesIrradiation / 100
+    weather[['ghi', 'dni', 'dhi']] *= irradiation_factor
 
     # run model chain with weather data
     mc.run_model(weather)
@@ -113,27 +223,23 @@ def CalcPVPowerProfile(sodeleInput, currentPVPlant):
         # use single eta for inverter
         Pv_power_profile = currentPVPlant.numberOfInverters * mc.results.dc['p_mp'] * currentPVPlant.inverterEta  # [W]
 
-    # fill nan values of power profile with zero
-    Pv_power_profile = Pv_power_profile.fillna(0)
+    # fill nan values of power profile with zero, working on a numpy copy from here on
+    Pv_power_profile = Pv_power_profile.to_numpy(dtype=np.float64, copy=True)
+    Pv_power_profile[np.isnan(Pv_power_profile)] = 0
 
     # limit to lower bound = 0 if standby power should be ignored
     if not currentPVPlant.useStandByPowerInverter:
-        Pv_power_profile[Pv_power_profile < 0] = 0
+        np.maximum(Pv_power_profile, 0, out=Pv_power_profile)
 
     # calculate rated power of all installed modules to get specific energy generation within simulated time horizon
-    if currentPVPlant.modulesDatabaseType == 1:
-        # Sandia
-        modules_power_rated = current_module.Impo * current_module.Vmpo * n_modules  # [W_peak]
-        module_surfaceArea = current_module.Area * n_modules  # [m^2]
-    elif currentPVPlant.modulesDatabaseType == 2:
-        # CEC
-        modules_power_rated = current_module.I_mp_ref * current_module.V_mp_ref * n_modules  # [W_peak]
-        module_surfaceArea = current_module.A_c * n_modules  # [m^2]
-    else:
+    if currentPVPlant.modulesDatabaseType not in RATED_MODULE_PARAMETERS:
         raise ValueError('Invalid value for modulesDatabaseType')
+    ratedCurrent, ratedVoltage, area = RATED_MODULE_PARAMETERS[currentPVPlant.modulesDatabaseType]
+    modules_power_rated = current_module[ratedCurrent] * current_module[ratedVoltage] * n_modules  # [W_peak]
+    module_surfaceArea = current_module[area] * n_modules  # [m^2]
 
     # calculate energy profile from power profile
-    Pv_energy_profile = Pv_power_profile.values * 8760 / Pv_power_profile.size  # [Wh]
+    Pv_energy_profile = Pv_power_profile * 8760 / Pv_power_profile.size  # [Wh]
 
     return Pv_energy_profile / 1_000, module_surfaceArea, modules_power_rated / 1_000  # in [kWh], [m^2], [kWp]
 
@@ -186,19 +292,25 @@ def generateEnergyProfileDataFrame(sodeleInput):
     energyProfileColumns = []
     energyAreaProfileColumns = []
     surfaceAreaCollector = []
-    df_resultEnergyProfiles = pd.DataFrame()
+    energyProfileCollector = []
+    resultEnergyProfiles = {}
     for currentIdx, currentPVPlant in enumerate(sodeleInput.photovoltaicPlants):
         energyProfileColumn = f"PV-Anlage {currentIdx}: Energieprofile [kWh]"
-        df_resultEnergyProfiles[energyProfileColumn] = currentPVPlant.energyProfile
+        resultEnergyProfiles[energyProfileColumn] = currentPVPlant.energyProfile
         energyProfileColumns.append(energyProfileColumn)
+        energyProfileCollector.append(currentPVPlant.energyProfile)
         surfaceAreaCollector.append(currentPVPlant.surfaceArea)
 
         energyAreaProfileColumn = f"PV-Anlage {currentIdx}: Flächenspezifisches Energieprofil [kWh/m^2]"
-        df_resultEnergyProfiles[energyAreaProfileColumn] = currentPVPlant.energyProfileArea
+        resultEnergyProfiles[energyAreaProfileColumn] = currentPVPlant.energyProfileArea
         energyAreaProfileColumns.append(energyAreaProfileColumn)
 
-    df_resultEnergyProfiles["PV-Energieprofil aller Anlagen [kWh]"] = df_resultEnergyProfiles[energyProfileColumns].sum(axis=1)
-    df_resultEnergyProfiles["Flächenspezifisches PV-Energieprofil aller Anlagen [kWh/m^2]"] = (df_resultEnergyProfiles[energyProfileColumns].sum(axis=1)) / np.sum(surfaceAreaCollector)
+    energyProfileSum = np.stack(energyProfileCollector).sum(axis=0)
+    resultEnergyProfiles["PV-Energieprofil aller Anlagen [kWh]"] = energyProfileSum
+    resultEnergyProfiles["Flächenspezifisches PV-Energieprofil aller Anlagen [kWh/m^2]"] = energyProfileSum / np.sum(surfaceAreaCollector)
+
+    # build the dataframe in one go instead of adding the columns one by one
+    df_resultEnergyProfiles = pd.DataFrame(resultEnergyProfiles)
 
     return df_resultEnergyProfiles, energyProfileColumns, energyAreaProfileColumns
 
@@ -212,25 +324,28 @@ def generateSummaryDataFrame(sodeleInput):
     :return:           pd.DataFrame, pvPlantColumns
     """
     energyProfileCollector = []
-    energyProfileAreaCollector = []
     surfaceAreaCollector = []
     systemKWPCollector = []
     for currentPVPlant in sodeleInput.photovoltaicPlants:
         energyProfileCollector.append(currentPVPlant.energyProfile)
-        energyProfileAreaCollector.append(currentPVPlant.energyProfileArea)
         surfaceAreaCollector.append(currentPVPlant.surfaceArea)
         systemKWPCollector.append(currentPVPlant.systemKWP)
 
+    # stack the energy profiles once, one row per system
+    energyProfiles = np.stack(energyProfileCollector)
+    surfaceAreas = np.asarray(surfaceAreaCollector, dtype=np.float64)
+    systemKWPs = np.asarray(systemKWPCollector, dtype=np.float64)
+
     # sum over all energy profiles
-    energyProfileSum = np.sum(np.array(energyProfileCollector), axis=0)
+    energyProfileSum = energyProfiles.sum(axis=0)
 
     # specific energy yield of each system
-    energyPerSystem = np.sum(np.array(energyProfileCollector), axis=1)  # [kWh]
-    energyOverAllSystems = np.sum(energyProfileSum)  # [kWh]
-    energyPerSystemArea = energyPerSystem / np.array(surfaceAreaCollector)  # [kWh/m^2]
-    energyOverAllSystemsArea = sum(energyProfileSum) / np.sum(surfaceAreaCollector)  # [kWh/m^2]
-    energyKWPPerSystem = energyPerSystem / np.array(systemKWPCollector)  # [kWh/kWp]
-    energyKWPOverAllSystems = sum(energyProfileSum) / np.sum(systemKWPCollector)  # [kWh/kWp]
+    energyPerSystem = energyProfiles.sum(axis=1)  # [kWh]
+    energyOverAllSystems = energyProfileSum.sum()  # [kWh]
+    energyPerSystemArea = energyPerSystem / surfaceAreas  # [kWh/m^2]
+    energyOverAllSystemsArea = energyOverAllSystems / surfaceAreas.sum()  # [kWh/m^2]
+    energyKWPPerSystem = energyPerSystem / systemKWPs  # [kWh/kWp]
+    energyKWPOverAllSystems = energyOverAllSystems / systemKWPs.sum()  # [kWh/kWp]
 
     df_summary = pd.DataFrame()
     df_summary["Beschriebener Wert"] = ["Jahressumme Energieertrag [kWh]",
@@ -272,10 +387,9 @@ def buildResultDict(sodeleInput,
     :type df_summary:                   pd.DataFrame
     :param pvPlantColumns:              list of column names of the photovoltaic plants
     :type pvPlantColumns:               list
-    :return:
+    :return:    the result dict, the energy profiles are kept as numpy arrays and have to be serialized numpy aware
     """
 
-
     # serialize the data to a json format
     result = {
         "PhotovoltaicResults": {
@@ -284,8 +398,8 @@ def buildResultDict(sodeleInput,
     }
 
     for pvIndex in range(len(sodeleInput.photovoltaicPlants)):
-        energyProfile = df_resultEnergyProfiles[energyProfileColumns[pvIndex]].tolist()
-        energyAreaProfile = df_resultEnergyProfiles[energyAreaProfileColumns[pvIndex]].tolist()
+        energyProfile = df_resultEnergyProfiles[energyProfileColumns[pvIndex]].to_numpy()
+        energyAreaProfile = df_resultEnergyProfiles[energyAreaProfileColumns[pvIndex]].to_numpy()
         summary = df_summary[pvPlantColumns[pvIndex]].tolist()
         sumOfEnergyPerYear = summary[0]
         workSpecificEnergyPerYear = summary[1]
@@ -299,8 +413,8 @@ def buildResultDict(sodeleInput,
             "AreaSpecificEnergyPerYear": areaSpecificEnergyPerYear
         })
 
-    energyProfileOfAll = df_resultEnergyProfiles.iloc[:, -2].tolist()
-    energyAreaProfileOfAll = df_resultEnergyProfiles.iloc[:, -1].tolist()
+    energyProfileOfAll = df_resultEnergyProfiles.iloc[:, -2].to_numpy()
+    energyAreaProfileOfAll = df_resultEnergyProfiles.iloc[:, -1].to_numpy()
     summaryOfAll = df_summary.iloc[:, -1].tolist()
     sumOfEnergyPerYearOfAll = summaryOfAll[0]
     workSpecificEnergyPerYearOfAll = summaryOfAll[1]
@@ -317,6 +431,102 @@ def buildResultDict(sodeleInput,
     return result
 
 
+# site, solar position, airmass and prepared weather of a worker process, set once per process by initPVPlantWorker
+workerSite = None
+workerSolarPosition = None
+workerAirmass = None
+workerPreparedWeather = None
+
+
+def initPVPlantWorker(latitude, longitude, solarPosition, airmass, preparedWeather):
+    """
+    Initializes a worker process with the data shared by all plants, so it is only sent once per process.
+
+    :param latitude:        the latitude of the site
+    :type latitude:         float
+    :param longitude:       the longitude of the site
+    :type longitude:        float
+    :param solarPosition:   the solar position shared by all plants
+    :type solarPosition:    pd.DataFrame
+    :param airmass:         the airmass shared by all plants
+    :type airmass:          pd.DataFrame
+    :param preparedWeather: the weather data shared by all plants
+    :type preparedWeather:  pd.DataFrame
+    :return:
+    """
+    global workerSite, workerSolarPosition, workerAirmass, workerPreparedWeather
+    workerSite = (latitude, longitude)
+    workerSolarPosition = solarPosition
+    workerAirmass = airmass
+    workerPreparedWeather = preparedWeather
+
+
+def calculatePVPlantInWorker(currentPVPlant, moduleAndInverter):
+    """
+    Calculates the PV power profile of a single plant in a worker process.
+
+    :param currentPVPlant:      the current PV
+    :type currentPVPlant:       PhotovoltaicPlant
+    :param moduleAndInverter:   the module and inverter parameters of the plant
+    :type moduleAndInverter:    tuple[pd.Series, pd.Series]
+    :return:                    see calculatePVPowerProfileAtSite
+    """
+    return calculatePVPowerProfileAtSite(*workerSite, currentPVPlant, moduleAndInverter, workerSolarPosition, workerAirmass, workerPreparedWeather)
+
+
+def getMaxWorkers():
+    """
+    Returns the number of worker processes set by the env variable SODELE_MAX_WORKERS.
+    Values that are not a positive integer are ignored with a warning and the default of 1 is used.
+
+    :return:    the number of worker processes, 1 calculates all plants in this process
+    :rtype:     int
+    """
+    value = getValueForKey("SODELE_MAX_WORKERS", "1")
+    try:
+        maxWorkers = int(value)
+    except ValueError:
+        maxWorkers = 0
+    if maxWorkers < 1:
+        logging().warning(f"SODELE_MAX_WORKERS has to be a positive integer, but is '{value}'. The PV plants are calculated without worker processes.")
+        return 1
+    return maxWorkers
+
+
+def calculatePVPlants(sodeleInput):
+    """
+    Calculates the PV power profiles of all photovoltaic plants.
+
+    The plants are calculated one after another in this process by default. Starting a worker process costs more than
+    calculating a plant, especially for the exe, so parallel processes are only used if the env variable
+    SODELE_MAX_WORKERS is set to more than one.
+
+    :param sodeleInput:     the sodele input
+    :type sodeleInput:      SodeleInput
+    :return:                list of the CalcPVPowerProfile results, in the order of the photovoltaic plants
+    """
+    photovoltaicPlants = sodeleInput.photovoltaicPlants
+    if len(photovoltaicPlants) == 0:
+        return []
+
+    solarPosition = calculateSolarPosition(sodeleInput.weatherData)
+    airmass = calculateAirmass(sodeleInput.weatherData, solarPosition)
+    preparedWeather = prepareWeather(sodeleInput.weatherData)
+
+    # worker processes have to be enabled via the environment, 1 calculates all plants in this process
+    maxWorkers = min(len(photovoltaicPlants), getMaxWorkers())
+    if maxWorkers <= 1:
+        return [CalcPVPowerProfile(sodeleInput, currentPVPlant, solarPosition, preparedWeather=preparedWeather, airmass=airmass) for currentPVPlant in photovoltaicPlants]
+
+    # the databases are only read here, the workers get the parameters of their plant
+    modulesAndInverters = [currentPVPlant.getModulesAndInverters() for currentPVPlant in photovoltaicPlants]
+
+    # the workers only need the site and the prepared data, not the weather data itself, the plants are sent per task
+    initArgs = (sodeleInput.weatherData.latitude, sodeleInput.weatherData.longitude, solarPosition, airmass, preparedWeather)
+    with ProcessPoolExecutor(max_workers=maxWorkers, initializer=initPVPlantWorker, initargs=initArgs) as executor:
+        return list(executor.map(calculatePVPlantInWorker, photovoltaicPlants, modulesAndInverters))
+
+
 def simulatePVPlants(sodeleInput):
     """
     Start the Simulation
@@ -338,10 +548,9 @@ def simulatePVPlants(sodeleInput):
 
     logging().info("Calculate PV profiles and create graphs for " + str(sodeleInput) + " PV system(s)..")
 
-    # call CalcPVPowerProfile and write calculated energy profile to list
-    for currentIdx, currentPVPlant in enumerate(sodeleInput.photovoltaicPlants):
-        results = CalcPVPowerProfile(sodeleInput, currentPVPlant)
-        currentPVPlant.energyProfile = results[0].tolist()
+    # calculate the profiles of all plants and write the results to the plants
+    for currentPVPlant, results in zip(sodeleInput.photovoltaicPlants, calculatePVPlants(sodeleInput)):
+        currentPVPlant.energyProfile = results[0]
         currentPVPlant.surfaceArea = results[1]
         currentPVPlant.systemKWP = results[2]
         currentPVPlant.calculateProfileMetrics()
@@ -1,6 +1,5 @@
 import os
 
-import numpy as np
 import pandas as pd
 import pvlib
 
@@ -30,28 +29,21 @@ def generatePvLibDatabase(basePath):
     PV_modules = pvlib.pvsystem.retrieve_sam(name=None, path=modules_path)
     PV_inverters = pvlib.pvsystem.retrieve_sam(name=None, path=inverters_path)
 
-    # write to txt file
-    PVModules_names = pd.DataFrame(np.array(PV_modules.columns.values))
-
     current_date = pd.Timestamp.now()
     current_date = current_date.strftime("%Y-%m-%d")
     txt_filename = f"{current_date}_PV_Modulnamen.txt"
     # path name
     writePath_Modules = Path(basePath) / txt_filename
 
-    with open(writePath_Modules, 'w') as f:
-        OutputData_asString = PVModules_names.to_string(header=False, index=False)
-        f.write(OutputData_asString)
+    # write to txt file, one name per line
+    writePath_Modules.write_text("\n".join(map(str, PV_modules.columns)))
 
-    # write to txt file
-    PVInverter_names = pd.DataFrame(np.array(PV_inverters.columns.values))
     txt_filename = f"{current_date}_PV_Inverter.txt"
     # path name
     writePath_Inverter = Path(basePath) / txt_filename
 
-    with open(writePath_Inverter, 'w') as f:
-        OutputData_asString = PVInverter_names.to_string(header=False, index=False)
-        f.write(OutputData_asString)
+    # write to txt file, one name per line
+    writePath_Inverter.write_text("\n".join(map(str, PV_inverters.columns)))
 
     logging().info(f"The internal names of PV modules and inverters were written to {writePath_Modules} and {writePath_Inverter}.")
 
@@ -0,0 +1,129 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+ROOT_PATH = Path(__file__).resolve().parent.parent
+EPW_FILE_PATH = ROOT_PATH / "docs" / "TRY2015_Stuttgart_JahrEPW.epw"
+
+# sodele and dbi are located in src, the command line app in bin
+sys.path.insert(0, str(ROOT_PATH / "src"))
+sys.path.insert(0, str(ROOT_PATH / "bin"))
+
+# header of a DWD TRY .dat file, the metadata is in the lines 1, 2, 3, 6 and 7 and the column names in line 32
+DAT_HEADER_LINES = [
+    "Koordinatensystem : Lambert konform konisch",
+    "Rechtswert        : 3936500 Meter",
+    "Hochwert          : 2449500 Meter",
+    "Hoehenlage        : 450 Meter ueber NN",
+    "Erstellung des Datensatzes im Mai 2016",
+    "Testreferenzjahr fuer die Regressionstests",
+    "Art des TRY       : mittleres Jahr",
+    "Bezugszeitraum    : 1995-2012",
+    "Datenbasis: Beobachtungsdaten Zeitraum 1995-2012",
+    "Format: Stundenwerte",
+    "",
+    "Reihenfolge der Parameter:",
+    "RW Rechtswert                                                    [m]       {3670500;3671500..4389500}",
+    "HW Hochwert                                                      [m]       {2242500;2243500..3179500}",
+    "MM Monat                                                                   {1..12}",
+    "DD Tag                                                                     {1..28,30,31}",
+    "HH Stunde (MEZ!)                                                           {1..24}",
+    "t  Lufttemperatur in 2m Hoehe ueber Grund                        [GradC]",
+    "p  Luftdruck in Standorthoehe                                    [hPa]",
+    "WR Windrichtung in 10 m Hoehe ueber Grund                        [Grad]    {0..360;999}",
+    "WG Windgeschwindigkeit in 10 m Hoehe ueber Grund                 [m/s]",
+    "N  Bedeckungsgrad                                                [Achtel]  {0..8;9}",
+    "x  Wasserdampfgehalt, Mischungsverhaeltnis                       [g/kg]",
+    "RF Relative Feuchte in 2 m Hoehe ueber Grund                     [Prozent] {1..100}",
+    "B  Direkte Sonnenbestrahlungsstaerke (horiz. Ebene)              [W/m^2]   abwaerts gerichtet: positiv",
+    "D  Diffuse Sonnenbetrahlungsstaerke (horiz. Ebene)               [W/m^2]   abwaerts gerichtet: positiv",
+    "A  Bestrahlungsstaerke d. atm. Waermestrahlung (horiz. Ebene)    [W/m^2]   abwaerts gerichtet: positiv",
+    "E  Bestrahlungsstaerke d. terr. Waermestrahlung                  [W/m^2]   aufwaerts gerichtet: negativ",
+    "IL Qualitaetsbit bezueglich der Auswahlkriterien                           {0;1;2;3;4}",
+    "",
+    "",
+    "",
+    "RW      HW MM DD HH     t    p  WR   WG N    x  RF    B    D    A    E IL",
+    "***",
+]
+
+
+@pytest.fixture
+def datFilePath(tmp_path):
+    """
+    Writes a .dat file in the format of the DWD TRY datasets with 8760 reproducible hourly values.
+
+    :return:    The path to the .dat file.
+    :rtype:     pathlib.Path
+    """
+    rng = np.random.default_rng(2015)
+    # the hours of a TRY dataset run from 1 to 24 in CET
+    timeStamps = pd.date_range(start="2015-01-01 00:00:00", periods=8760, freq="H")
+    dayOfYear = timeStamps.dayofyear.to_numpy()
+    hourOfDay = timeStamps.hour.to_numpy() + 0.5
+
+    # irradiation with a daily and a seasonal course, zero at night
+    sunHeight = np.sin((hourOfDay - 6) / 12 * np.pi) * (0.6 + 0.4 * np.sin((dayOfYear - 80) / 365 * 2 * np.pi))
+    sunHeight = np.clip(sunHeight, 0, None)
+    direct = np.rint(sunHeight * rng.uniform(0, 700, 8760)).astype(int)
+    diffuse = np.rint(sunHeight * rng.uniform(20, 250, 8760)).astype(int)
+
+    temperature = np.round(10 - 10 * np.cos((dayOfYear - 15) / 365 * 2 * np.pi) + rng.normal(0, 3, 8760), 1)
+    pressure = rng.integers(940, 990, 8760)
+    windDirection = rng.integers(0, 361, 8760)
+    windSpeed = np.round(rng.uniform(0, 12, 8760), 1)
+    cloudCover = rng.integers(0, 9, 8760)
+    waterVapour = np.round(rng.uniform(2, 12, 8760), 1)
+    relativeHumidity = rng.integers(30, 101, 8760)
+    atmosphericIrradiation = rng.integers(250, 400, 8760)
+    terrestrialIrradiation = -rng.integers(300, 450, 8760)
+    qualityBit = rng.integers(0, 5, 8760)
+
+    dataLines = [f"3936500 2449500 {timeStamp.month:2d} {timeStamp.day:2d} {timeStamp.hour + 1:2d} "
+                 f"{temperature[i]:5.1f} {pressure[i]:4d} {windDirection[i]:3d} {windSpeed[i]:4.1f} {cloudCover[i]:1d} "
+                 f"{waterVapour[i]:4.1f} {relativeHumidity[i]:3d} {direct[i]:4d} {diffuse[i]:4d} "
+                 f"{atmosphericIrradiation[i]:4d} {terrestrialIrradiation[i]:4d} {qualityBit[i]:2d}"
+                 for i, timeStamp in enumerate(timeStamps)]
+
+    path = tmp_path / "TRY2015_regression.dat"
+    path.write_text("\n".join(DAT_HEADER_LINES + dataLines) + "\n", encoding="latin-1")
+    return path
+
+
+@pytest.fixture
+def epwFilePath():
+    """
+    The EPW file of the documentation, which is written with the Windows code page.
+
+    :return:    The path to the EPW file.
+    :rtype:     pathlib.Path
+    """
+    return EPW_FILE_PATH
+
+
+@pytest.fixture(params=["epw", "dat"])
+def weatherDataFilePath(request, datFilePath):
+    """
+    Runs a test for both weather data formats, the EPW file of the documentation and the generated .dat file.
+
+    :return:    The path to the weather data file.
+    :rtype:     pathlib.Path
+    """
+    if request.param == "epw":
+        return EPW_FILE_PATH
+    return datFilePath
+
+
+@pytest.fixture
+def rootPath(monkeypatch):
+    """
+    Runs a test in the root of the repository, the paths of the module and inverter databases are relative to it.
+
+    :return:    The path to the root of the repository.
+    :rtype:     pathlib.Path
+    """
+    monkeypatch.chdir(ROOT_PATH)
+    return ROOT_PATH
@@ -0,0 +1,85 @@
+import json
+import logging
+
+import numpy as np
+import pandas as pd
+import pvlib
+import pytest
+
+import app
+import sodele.PVSImulation as PVSImulation
+from sodele import SodeleInput
+
+
+def readInSodeleInput(rootPath, datFilePath):
+    """
+    Reads in the photovoltaic plants of the test input of the documentation with the weather data of the .dat file,
+    prepared as in simulatePVPlants.
+    """
+    with open(rootPath / "docs" / "testInput.json", "r") as f:
+        inputJsonDict = json.load(f)
+    weatherData = app.readInWeatherDataFile(str(datFilePath))
+    weatherData.adjustTimeStamp(weatherData.timeshiftInMinutes)
+    weatherData.recalculateDNI()
+    return SodeleInput.deserialize(inputJsonDict, weatherData)
+
+
+def test_sharedSitePositionModelChainMatchesModelChain(monkeypatch, rootPath, datFilePath):
+    sodeleInput = readInSodeleInput(rootPath, datFilePath)
+    sharedModelChains = []
+
+    class RecordingModelChain(PVSImulation.SharedSitePositionModelChain):
+        def __init__(self, system, location, solarPosition, airmass, **kwargs):
+            super().__init__(system, location, solarPosition, airmass, **kwargs)
+            self.modelChainArguments = kwargs
+            sharedModelChains.append(self)
+
+        def run_model(self, weather):
+            self.weather = weather
+            return super().run_model(weather)
+
+    monkeypatch.setattr(PVSImulation, "SharedSitePositionModelChain", RecordingModelChain)
+    PVSImulation.CalcPVPowerProfile(sodeleInput, sodeleInput.photovoltaicPlants[0])
+
+    # the same plant with the solar position and airmass calculated by the ModelChain itself
+    sharedModelChain, = sharedModelChains
+    modelChain = pvlib.modelchain.ModelChain(sharedModelChain.system, sharedModelChain.location, **sharedModelChain.modelChainArguments)
+    modelChain.run_model(sharedModelChain.weather)
+
+    pd.testing.assert_frame_equal(sharedModelChain.results.dc, modelChain.results.dc, check_exact=True)
+    pd.testing.assert_series_equal(sharedModelChain.results.ac, modelChain.results.ac, check_exact=True)
+
+
+def test_calculatePVPlantsInWorkerProcessesMatchesSerial(monkeypatch, rootPath, datFilePath):
+    sodeleInput = readInSodeleInput(rootPath, datFilePath)
+
+    monkeypatch.setenv("SODELE_MAX_WORKERS", "1")
+    serialResults = PVSImulation.calculatePVPlants(sodeleInput)
+    monkeypatch.setenv("SODELE_MAX_WORKERS", "2")
+    parallelResults = PVSImulation.calculatePVPlants(sodeleInput)
+
+    # the plants have different orientations, so a changed order would be noticed
+    assert not np.array_equal(serialResults[0][0], serialResults[1][0])
+    assert len(parallelResults) == len(serialResults) == len(sodeleInput.photovoltaicPlants)
+    for serialResult, parallelResult in zip(serialResults, parallelResults):
+        np.testing.assert_array_equal(parallelResult[0], serialResult[0])
+        assert parallelResult[1:] == serialResult[1:]
+
+
+@pytest.mark.parametrize("value", ["0", "-2", "abc", "1.5"])
+def test_getMaxWorkersFallsBackToOneWorker(monkeypatch, caplog, value):
+    monkeypatch.setenv("SODELE_MAX_WORKERS", value)
+
+    with caplog.at_level(logging.WARNING, logger="SODELE"):
+        assert PVSImulation.getMaxWorkers() == 1
+
+    assert "SODELE_MAX_WORKERS" in caplog.text
+
+
+def test_getMaxWorkersReadsEnvironment(monkeypatch, caplog):
+    monkeypatch.setenv("SODELE_MAX_WORKERS", "3")
+
+    with caplog.at_level(logging.WARNING, logger="SODELE"):
+        assert PVSImulation.getMaxWorkers() == 3
+
+    assert caplog.text == ""
@@ -0,0 +1,78 @@
+import numpy as np
+import pandas as pd
+import pvlib
+import pytest
+
+import app
+from sodele import WeatherData
+from sodele.Objects.WeatherData import FLOAT32_COLUMNS
+
+
+def recalculateDNIBaseline(weatherData):
+    """
+    The DNI recalculation before it was changed to work in place, used as reference for the regression tests.
+    """
+    df_weatherData = weatherData.df_weatherData
+    solarPosition = pvlib.solarposition.get_solarposition(df_weatherData.index,
+                                                          weatherData.latitude, weatherData.longitude, altitude=weatherData.altitude,
+                                                          pressure=df_weatherData["atmospheric_pressure"],
+                                                          method='nrel_numpy')
+    dni = pvlib.irradiance.dni(df_weatherData["ghi"], df_weatherData["dhi"], solarPosition["zenith"])
+    dni = dni.fillna(0.0)
+    dni = np.nan_to_num(dni, nan=0.0)
+    dni[dni == -0.0] = 0.0
+    return dni
+
+
+def createWeatherData(timeIndex):
+    df_weatherData = pd.DataFrame({"ghi": np.zeros(len(timeIndex))}, index=timeIndex)
+    return WeatherData(altitude=450, kind="test", years=1, latitude=48.8, longitude=9.2, tz=1,
+                       adjustTimestamp=True, recalculateDNI=True, timeshiftInMinutes=30,
+                       df_weatherData=df_weatherData)
+
+
+def test_recalculateDNIMatchesBaseline(weatherDataFilePath):
+    weatherData = app.readInWeatherDataFile(str(weatherDataFilePath))
+    weatherData.adjustTimeStamp(weatherData.timeshiftInMinutes)
+    expected = recalculateDNIBaseline(weatherData)
+
+    weatherData.recalculateDNI()
+
+    np.testing.assert_array_equal(weatherData.df_weatherData["dni"].to_numpy(), expected)
+
+
+@pytest.mark.parametrize("tz", [None, 3600, "Europe/Berlin"])
+@pytest.mark.parametrize("timeshift", [30, -90, 7.5])
+def test_adjustTimeStampMatchesBaseline(tz, timeshift):
+    timeIndex = pd.date_range(start="2015-01-01 00:00:00", end="2015-12-31 23:00:00", freq="H", tz=tz)
+    weatherData = createWeatherData(timeIndex)
+
+    weatherData.adjustTimeStamp(timeshift)
+
+    expected = timeIndex + pd.Timedelta(minutes=timeshift)
+    newTimeIndex = weatherData.df_weatherData.index
+    assert newTimeIndex.tz == expected.tz
+    assert newTimeIndex.freq == timeIndex.freq
+    np.testing.assert_array_equal(newTimeIndex.asi8, expected.asi8)
+
+
+def test_deserializeKeepsIrradiationAndPressureAsFloat64(datFilePath):
+    weatherData = app.readInWeatherDataFile(str(datFilePath))
+
+    df_weatherData = WeatherData.deserialize(weatherData.serialize()).df_weatherData
+
+    for column in df_weatherData.columns:
+        dtype = np.float32 if column in FLOAT32_COLUMNS else np.float64
+        assert df_weatherData[column].dtype == dtype, column
+        np.testing.assert_array_equal(df_weatherData[column].to_numpy(), weatherData.df_weatherData[column].to_numpy(dtype=dtype))
+
+
+def test_recalculateDNILeavesNoNegativeZeros(weatherDataFilePath):
+    weatherData = app.readInWeatherDataFile(str(weatherDataFilePath))
+    weatherData.adjustTimeStamp(weatherData.timeshiftInMinutes)
+
+    weatherData.recalculateDNI()
+
+    dni = weatherData.df_weatherData["dni"].to_numpy()
+    assert (dni == 0.0).any()
+    assert not np.signbit(dni[dni == 0.0]).any()
@@ -0,0 +1,123 @@
+import numpy as np
+import pandas as pd
+import pyproj
+import pytest
+
+import app
+from sodele.Objects.WeatherData import FLOAT32_COLUMNS
+
+
+def readInDatFileBaseline(datFilePath):
+    """
+    The .dat reader before it was rewritten to parse the whole file at once, used as reference for the regression tests.
+    """
+    datfile = open(str(datFilePath), 'r')
+
+    metadata = dict()
+    currentline = 0
+    for line in datfile:
+        row = line.rstrip().split(":", 1)
+        if currentline == 1:
+            metadata['Rechtswert'] = int(row[1].split()[0])
+        elif currentline == 2:
+            metadata['Hochwert'] = int(row[1].split()[0])
+        elif currentline == 3:
+            metadata['altitude'] = float(row[1].split()[0])
+        elif currentline == 6:
+            metadata['kind'] = str(row[1])
+        elif currentline == 7:
+            metadata['years'] = str(row[1])
+        elif currentline == 32:
+            columnnames = row[0].split()
+        currentline += 1
+        if row[0] == '***':
+            break
+
+    transformer = pyproj.Transformer.from_crs('EPSG:3034', 'EPSG:4326')
+    lat, lon = transformer.transform(metadata['Hochwert'], metadata['Rechtswert'])
+    metadata['latitude'] = lat
+    metadata['longitude'] = lon
+    metadata['TZ'] = 1
+
+    dat_data = pd.read_table(datfile, header=None, names=columnnames, delim_whitespace=True)
+    datfile.close()
+    dat_data.index = pd.DatetimeIndex(pd.date_range(start=f'{2015}-01-01 00:00:00', end=f'{2015}-12-31 23:00:00', freq='H', tz=int(metadata['TZ'] * 60 * 60)))
+    dat_data["p"] = dat_data["p"] * 100
+
+    df_weatherData = pd.DataFrame()
+    df_weatherData.index = dat_data.index
+    df_weatherData["temp_air"] = dat_data["t"]
+    df_weatherData["relative_humidity"] = dat_data["RF"]
+    df_weatherData["wind_speed"] = dat_data["WG"]
+    df_weatherData["atmospheric_pressure"] = dat_data["p"]
+    df_weatherData["dhi"] = dat_data["D"]
+    df_weatherData["ghi"] = df_weatherData["dhi"] + dat_data["B"]
+
+    return df_weatherData, metadata
+
+
+def test_parseDatFileMatchesBaseline(datFilePath):
+    df_weatherData, metadata = app.readInDatFile(datFilePath)
+    df_expected, metadataExpected = readInDatFileBaseline(datFilePath)
+
+    # the values are read as float64 and have to be identical, the baseline kept integer columns as int64
+    pd.testing.assert_frame_equal(df_weatherData, df_expected, check_dtype=False, check_exact=True)
+    assert metadata == metadataExpected
+
+
+def test_readInDatFileHandsOutCopies(datFilePath):
+    df_first, metadataFirst = app.readInDatFile(datFilePath)
+    df_first["ghi"] = 0.0
+    metadataFirst["kind"] = "changed"
+
+    df_second, metadataSecond = app.readInDatFile(datFilePath)
+
+    assert df_second["ghi"].max() > 0
+    assert metadataSecond["kind"] == " mittleres Jahr"
+
+
+def test_tryWeatherDataKeepsIrradiationAndPressureAsFloat64(datFilePath):
+    weatherData = app.readInWeatherDataFile(str(datFilePath))
+    df_weatherData = weatherData.df_weatherData
+    df_expected, _ = readInDatFileBaseline(datFilePath)
+
+    for column in df_weatherData.columns:
+        if column in FLOAT32_COLUMNS:
+            assert df_weatherData[column].dtype == np.float32, column
+            np.testing.assert_array_equal(df_weatherData[column].to_numpy(), df_expected[column].to_numpy(dtype=np.float32))
+        else:
+            assert df_weatherData[column].dtype == np.float64, column
+            np.testing.assert_array_equal(df_weatherData[column].to_numpy(), df_expected[column].to_numpy(dtype=np.float64))
+
+
+def test_readInDatFileWithoutSeparatorRaises(datFilePath, tmp_path):
+    path = tmp_path / "missing.dat"
+    path.write_bytes(datFilePath.read_bytes().replace(b"\n***\n", b"\n"))
+
+    with pytest.raises(ValueError, match=r"missing\.dat\. Checke the \.dat file"):
+        app.readInDatFile(path)
+
+
+def test_readInDatFileWithWindowsLineEndings(datFilePath, tmp_path):
+    path = tmp_path / "windows.dat"
+    path.write_bytes(datFilePath.read_bytes().replace(b"\n", b"\r\n"))
+
+    df_weatherData, metadata = app.readInDatFile(path)
+    df_expected, metadataExpected = app.readInDatFile(datFilePath)
+
+    pd.testing.assert_frame_equal(df_weatherData, df_expected, check_exact=True)
+    assert metadata == metadataExpected
+
+
+def test_readInDatFileReadsMetadataByKey(datFilePath, tmp_path):
+    # an additional header line moves the metadata and the column names to other line numbers
+    lines = datFilePath.read_text(encoding="latin-1").split("\n")
+    lines.insert(1, "Quelle            : Deutscher Wetterdienst")
+    path = tmp_path / "additionalHeaderLine.dat"
+    path.write_text("\n".join(lines), encoding="latin-1")
+
+    df_weatherData, metadata = app.readInDatFile(path)
+    df_expected, metadataExpected = app.readInDatFile(datFilePath)
+
+    pd.testing.assert_frame_equal(df_weatherData, df_expected, check_exact=True)
+    assert metadata == metadataExpected
@@ -0,0 +1,11 @@
+import pandas as pd
+
+import app
+
+
+def test_readInEPWFileTimeStampsMatchBaseline(epwFilePath):
+    df_weather = app.readInWeatherDataFile(str(epwFilePath)).df_weatherData
+
+    # the time stamps were built from the date columns of each row before
+    expected = pd.to_datetime(dict(year=df_weather["year"], month=df_weather["month"], day=df_weather["day"], hour=df_weather["hour"]))
+    pd.testing.assert_series_equal(df_weather["timeStamps"], expected, check_names=False)